@@ -2,22 +2,30 @@ from django.shortcuts import get_object_or_404, render
 from django.http import HttpResponse, Http404, HttpResponseRedirect
 from django.template import loader
 from django.urls import reverse
+from django.views.decorators.cache import cache_page
 
 
+# las páginas son estáticas: se guardan un minuto para no renderizarlas en cada visita
+@cache_page(60)
 def index(request):
     return render(request,"sonif1D/index.html")
 
+@cache_page(60)
 def inicio(request):
     return render(request,"sonif1D/inicio.html")
 
+@cache_page(60)
 def ayuda(request):
     return render(request,"sonif1D/ayuda.html")
 
+@cache_page(60)
 def sonido(request):
     return render(request, "sonif1D/sonido.html")
 
+@cache_page(60)
 def grafico(request):
     return render(request, "sonif1D/grafico.html")
 
+@cache_page(60)
 def funciones_matematicas(request):
     return render(request, "sonif1D/funciones_matematicas.html")
\ No newline at end of file
@@ -30,7 +30,7 @@ ALLOWED_HOSTS = []
 
 # Static Dir and Static root needs to be different
 
-STATICFILES_DIRS = [str(BASE_DIR) + '/sonounoweb/plantilla/static']
+STATICFILES_DIRS = [BASE_DIR / 'sonounoweb' / 'plantilla' / 'static']
 
 # Application definition
 
@@ -47,6 +47,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -1,4 +1,5 @@
 # una vez implementada la app se borrará este archivo
+from functools import lru_cache
 from pathlib import Path
 
 from django.http import HttpResponse
@@ -6,53 +7,48 @@ from django.template import Template, Context
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
+PLANTILLA_DIR = BASE_DIR / 'sonounoweb' / 'plantilla'
+
+# las plantillas se leen y compilan una sola vez por proceso
+@lru_cache(maxsize=None)
+def cargarPlantilla (nombre):
+	with open (PLANTILLA_DIR / nombre) as plantillaExterna:
+		return Template (plantillaExterna.read())
 
 def index (request):
-	plantillaExterna = open (str(BASE_DIR) + '/sonounoweb/plantilla/index.html')
-	template = Template (plantillaExterna.read())
-	plantillaExterna.close()
+	template = cargarPlantilla ('index.html')
 	contexto = Context()
 	documento = template.render (contexto)
 	return HttpResponse (documento)
-	
+
 def sonido (request):
-	plantillaExterna = open (str(BASE_DIR) + '/sonounoweb/plantilla/sonido.html')
-	template = Template (plantillaExterna.read())
-	plantillaExterna.close()
+	template = cargarPlantilla ('sonido.html')
 	contexto = Context()
 	documento = template.render (contexto)
 	return HttpResponse (documento)
-	
+
 def grafico (request):
-	plantillaExterna = open (str(BASE_DIR) + '/sonounoweb/plantilla/grafico.html')
-	template = Template (plantillaExterna.read())
-	plantillaExterna.close()
+	template = cargarPlantilla ('grafico.html')
 	contexto = Context()
 	documento = template.render (contexto)
 	return HttpResponse (documento)
-	
+
 def funciones_matematicas (request):
-	plantillaExterna = open (str(BASE_DIR) + '/sonounoweb/plantilla/funciones_matematicas.html')
-	template = Template (plantillaExterna.read())
-	plantillaExterna.close()
+	template = cargarPlantilla ('funciones_matematicas.html')
 	contexto = Context()
 	documento = template.render (contexto)
 	return HttpResponse (documento)
-		
+
 def inicio (request):
-	plantillaExterna = open (str(BASE_DIR) + '/sonounoweb/plantilla/inicio.html')
-	template = Template (plantillaExterna.read())
-	plantillaExterna.close()
+	template = cargarPlantilla ('inicio.html')
 	contexto = Context()
 	documento = template.render (contexto)
 	return HttpResponse (documento)
-	
+
 def ayuda (request):
-	plantillaExterna = open (str(BASE_DIR) + '/sonounoweb/plantilla/ayuda.html')
-	template = Template (plantillaExterna.read())
-	plantillaExterna.close()
+	template = cargarPlantilla ('ayuda.html')
 	contexto = Context()
 	documento = template.render (contexto)
 	return HttpResponse (documento)
-	
+
 